@@ -1,5 +1,5 @@
 """Utils using Google APIs."""
 
-from ug.maps import search_maps, google_maps_url
+from ug.maps import search_maps, google_maps_url, google_maps_urls_bulk
 
 from ug.forms import dataframe_to_form
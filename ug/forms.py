@@ -17,11 +17,22 @@ Just try the function out, and get AI to help your through the credentials hell.
 from typing import Optional, Dict
 from typing import Literal
 import os
+import math
+import time
+import queue
+import hashlib
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 import google.auth
 from googleapiclient.discovery import build
+from googleapiclient.discovery_cache.base import Cache
+from googleapiclient.errors import HttpError, UnknownApiNameOrVersion
 from google_auth_oauthlib.flow import InstalledAppFlow
 
+from ug.util import DFLT_CACHE_DIR, backoff_seconds
+
 
 # Define valid Google Forms element types
 ElementType = Literal[
@@ -36,6 +47,19 @@ ElementType = Literal[
 Field = str
 ExtraInfo = str
 
+# Maximum number of calls per multipart batch request (Google's limit is 1000, but
+# smaller batches are gentler on per-user quotas and partial failures)
+DFLT_BATCH_SIZE = 100
+# Number of threads building forms concurrently (each with a service of its own)
+DFLT_MAX_WORKERS = 4
+# Maximum number of (batch) requests in flight at any time, across all threads
+DFLT_MAX_IN_FLIGHT = 4
+# HTTP statuses signaling a transient condition (rate limit, unavailable) worth retrying
+RETRIABLE_STATUSES = (429, 500, 503)
+DFLT_MAX_TRIES = 6
+
+FORMS_SCOPES = ['https://www.googleapis.com/auth/forms.body']
+
 
 def dataframe_to_form(
     form_table: 'pandas.DataFrame',
@@ -44,6 +68,7 @@ def dataframe_to_form(
     field_extra_info: Optional[Dict[Field, ExtraInfo]] = None,
     static_texts: Optional[Dict[int, str]] = None,
     client_secrets_file: Optional[str] = None,
+    max_workers: int = DFLT_MAX_WORKERS,
 ):
     r"""
     Converts each row of a DataFrame into a Google Form with fields pre-populated
@@ -57,8 +82,10 @@ def dataframe_to_form(
 
     :param form_table: The DataFrame containing the form data.
     :param field_element_types: Optional dict mapping fields to Google Forms element types.
-    :param field_extra_info: Optional dict mapping fields to extra information/instructions.
+    :param field_extra_info: Optional dict mapping fields to extra information/instructions
+        (for choice fields, their comma-separated options).
     :param static_texts: Optional dict mapping positions to static text content.
+    :param max_workers: Maximum number of threads creating forms concurrently.
     :return: A list of dicts containing form IDs and URLs.
 
     Example usage:
@@ -98,8 +125,6 @@ def dataframe_to_form(
 
     """
 
-    import pandas as pd
-
     if not client_secrets_file:
         if not (client_secrets_file := os.getenv('HFN_GOOGLE_CLIENT_JSON_PATH')):
             raise ValueError(
@@ -120,161 +145,306 @@ def dataframe_to_form(
             }
             return static_text_item
 
-    def authenticate():
-        # Authenticate and build the Google Forms API service
-        SCOPES = ['https://www.googleapis.com/auth/forms.body']
-        flow = InstalledAppFlow.from_client_secrets_file(client_secrets_file, SCOPES)
-        creds = flow.run_local_server(port=0)
-        service = build('forms', 'v1', credentials=creds)
-        return service
-
-    def create_question_item(question_title, question_type, extra_info):
-        # Map the question_type to Google Forms API item types
-        question_item = {}
-        if question_type == 'TEXT':
-            question_item = {
-                "createItem": {
-                    "item": {
-                        "title": question_title,
-                        "description": extra_info,
-                        "questionItem": {"question": {"textQuestion": {}}},
-                    },
-                    "location": {"index": 0},
-                }
-            }
-        elif question_type == 'PARAGRAPH_TEXT':
-            question_item = {
-                "createItem": {
-                    "item": {
-                        "title": question_title,
-                        "description": extra_info,
-                        "questionItem": {"question": {"paragraphQuestion": {}}},
-                    },
-                    "location": {"index": 0},
-                }
-            }
-        elif question_type in ['MULTIPLE_CHOICE', 'CHECKBOXES', 'DROPDOWN']:
-            # Extract options from extra_info, if provided
-            options = (
-                [{"value": opt.strip()} for opt in extra_info.split(',')]
-                if extra_info
-                else [{"value": "Option 1"}, {"value": "Option 2"}]
-            )
-            choice_type = {
-                'MULTIPLE_CHOICE': 'RADIO',
-                'CHECKBOXES': 'CHECKBOX',
-                'DROPDOWN': 'DROP_DOWN',
-            }[question_type]
-            question_item = {
-                "createItem": {
-                    "item": {
-                        "title": question_title,
-                        "questionItem": {
-                            "question": {
-                                "choiceQuestion": {
-                                    "type": choice_type,
-                                    "options": options,
-                                }
-                            }
-                        },
-                    },
-                    "location": {"index": 0},
-                }
-            }
-        elif question_type == 'DATE':
-            question_item = {
-                "createItem": {
-                    "item": {
-                        "title": question_title,
-                        "description": extra_info,
-                        "questionItem": {"question": {"dateQuestion": {}}},
-                    },
-                    "location": {"index": 0},
-                }
-            }
-        elif question_type == 'TIME':
-            question_item = {
-                "createItem": {
-                    "item": {
-                        "title": question_title,
-                        "description": extra_info,
-                        "questionItem": {"question": {"timeQuestion": {}}},
-                    },
-                    "location": {"index": 0},
-                }
-            }
+    # Authenticate with the Google Forms API
+    creds = get_credentials(client_secrets_file)
+
+    columns = list(form_table.columns)
+
+    # The static texts are the same for every form
+    static_text_requests = []
+    if static_texts:
+        for position, text_content in sorted(static_texts.items()):
+            static_text_item = create_static_text_item(text_content)
+            static_text_item['createItem']['location']['index'] = position
+            static_text_requests.append(static_text_item)
+
+    # Only the current value differs from row to row, so prepare the rest per field
+    question_types = {
+        field: field_element_types.get(field, 'TEXT') if field_element_types else 'TEXT'
+        for field in columns
+    }
+    description_prefixes = {}
+    item_templates = {}
+    for field in columns:
+        extra_info = field_extra_info.get(field, '') if field_extra_info else ''
+        if question_types[field] in _CHOICE_TYPES:
+            # The extra info of choice questions holds their options
+            options = parse_choice_options(extra_info)
+            extra_info = ''
         else:
-            # Default to TEXT if unknown type
-            question_item = {
-                "createItem": {
-                    "item": {
-                        "title": question_title,
-                        "description": extra_info,
-                        "questionItem": {"question": {"textQuestion": {}}},
-                    },
-                    "location": {"index": 0},
-                }
-            }
-        return question_item
+            options = None
+        # Include existing value in the question description
+        description_prefixes[field] = (
+            f"{extra_info}\nCurrent value: " if extra_info else "Current value: "
+        )
+        question_item = create_question_item(
+            f"{field}", question_types[field], options=options
+        )
+        item_templates[field] = question_item['createItem']['item']
+
+    def row_question_item(field, existing_value):
+        question_description = description_prefixes[field] + existing_value
+        item = {**item_templates[field], 'description': question_description}
+        return {"createItem": {"item": item, "location": {"index": 0}}}
+
+    def row_requests(row_values):
+        return static_text_requests + [
+            row_question_item(field, existing_value)
+            for field, existing_value in zip(columns, row_values)
+        ]
+
+    # Build all the payloads up front, so that the network phase is just network
+    form_titles = [f"Form for Row {index + 1}" for index in form_table.index]
+    # Missing values become empty strings, and the rest their string representation
+    str_table = form_table.astype(object).where(form_table.notna(), '').astype(str)
+    rows_requests = [
+        row_requests(row_values)
+        for row_values in str_table.itertuples(index=False, name=None)
+    ]
+
+    def build_forms(titles, requests_per_form):
+        # googleapiclient services aren't thread-safe, so each worker checks one out
+        with forms_service(creds) as service:
+            # Create the forms in (multipart) batches instead of one round trip per row
+            create_form_requests = [
+                service.forms().create(
+                    body={"info": {"title": title, "documentTitle": title}}
+                )
+                for title in titles
+            ]
+            form_ids = [
+                response['formId']
+                for response in _batch_execute(service, create_form_requests)
+            ]
+
+            # Update the forms with the new questions, with the same batching
+            update_form_requests = [
+                service.forms().batchUpdate(formId=form_id, body={'requests': requests})
+                for form_id, requests in zip(form_ids, requests_per_form)
+            ]
+            _batch_execute(service, update_form_requests)
+
+            return form_ids
+
+    # Spread the rows over the workers, in chunks no bigger than a batch
+    n_forms = len(form_titles)
+    chunk_size = max(1, min(DFLT_BATCH_SIZE, math.ceil(n_forms / max_workers)))
+    chunk_starts = range(0, n_forms, chunk_size)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        chunks_form_ids = executor.map(
+            lambda i: build_forms(
+                form_titles[i : i + chunk_size], rows_requests[i : i + chunk_size]
+            ),
+            chunk_starts,
+        )
+        form_ids = [form_id for chunk in chunks_form_ids for form_id in chunk]
+
+    # Collect form information
+    forms_info = [
+        {
+            'form_id': form_id,
+            'form_edit_url': f"https://docs.google.com/forms/d/{form_id}/edit",
+            'form_response_url': f"https://docs.google.com/forms/d/{form_id}/viewform",
+        }
+        for form_id in form_ids
+    ]
 
-    # Authenticate with the Google Forms API
-    service = authenticate()
+    return forms_info
 
-    forms_info = []
 
-    for index, row in form_table.iterrows():
-        # Create a new form for each row
-        form_title = f"Form for Row {index + 1}"
-        form = {"info": {"title": form_title, "documentTitle": form_title}}
-        form_response = service.forms().create(body=form).execute()
-        form_id = form_response['formId']
+# The Google Forms API question of the element types that need no other settings
+_QUESTION_KINDS = {
+    'TEXT': 'textQuestion',
+    'PARAGRAPH_TEXT': 'paragraphQuestion',
+    'DATE': 'dateQuestion',
+    'TIME': 'timeQuestion',
+}
+# The Google Forms API choice type of the element types that are choice questions
+_CHOICE_TYPES = {
+    'MULTIPLE_CHOICE': 'RADIO',
+    'CHECKBOXES': 'CHECKBOX',
+    'DROPDOWN': 'DROP_DOWN',
+}
 
-        requests = []
 
-        if static_texts:
-            for position, text_content in sorted(static_texts.items()):
-                static_text_item = create_static_text_item(text_content)
-                static_text_item['createItem']['location']['index'] = position
-                requests.append(static_text_item)
+def create_question_item(
+    question_title, question_type, description='', *, options=None
+):
+    """Make the request creating a question item of type ``question_type``.
 
-        for field in form_table.columns:
-            existing_value = row[field]
-            if pd.isna(existing_value):
-                existing_value = ''
-            else:
-                existing_value = str(existing_value)
+    The ``options`` of choice questions are ``{"value": ...}`` dicts, as made by
+    ``parse_choice_options``, and default to two placeholder options.
+    Unknown types default to ``'TEXT'``.
+    """
+    if (choice_type := _CHOICE_TYPES.get(question_type)) is not None:
+        if options is None:
+            options = [{"value": "Option 1"}, {"value": "Option 2"}]
+        question = {"choiceQuestion": {"type": choice_type, "options": options}}
+    else:
+        question = {_QUESTION_KINDS.get(question_type, 'textQuestion'): {}}
+    item = {
+        "title": question_title,
+        "description": description,
+        "questionItem": {"question": question},
+    }
+    return {"createItem": {"item": item, "location": {"index": 0}}}
+
+
+def parse_choice_options(extra_info: str):
+    """Parse comma-separated options into choice question options (None if empty).
+
+    >>> parse_choice_options('Yes, No ,Maybe')
+    [{'value': 'Yes'}, {'value': 'No'}, {'value': 'Maybe'}]
+    """
+    if extra_info:
+        return [{"value": opt.strip()} for opt in extra_info.split(',')]
 
-            question_type = (
-                field_element_types.get(field, 'TEXT')
-                if field_element_types
-                else 'TEXT'
-            )
-            extra_info = field_extra_info.get(field, '') if field_extra_info else ''
-
-            # Include existing value in the question description
-            question_title = f"{field}"
-            question_description = (
-                f"{extra_info}\nCurrent value: {existing_value}"
-                if extra_info
-                else f"Current value: {existing_value}"
-            )
 
-            question_item = create_question_item(
-                question_title, question_type, question_description
-            )
-            requests.append(question_item)
-
-        # Update the form with the new questions
-        body = {'requests': requests}
-        service.forms().batchUpdate(formId=form_id, body=body).execute()
-
-        # Collect form information
-        forms_info.append(
-            {
-                'form_id': form_id,
-                'form_edit_url': f"https://docs.google.com/forms/d/{form_id}/edit",
-                'form_response_url': f"https://docs.google.com/forms/d/{form_id}/viewform",
-            }
+_credentials = {}
+# credentials -> queue of the (idle) services authorized with them
+_idle_forms_services = {}
+_idle_forms_services_lock = threading.Lock()
+
+
+def get_credentials(client_secrets_file: str):
+    """Get credentials for the Google Forms API.
+
+    The OAuth flow only runs the first time for a given ``client_secrets_file``.
+    """
+    if client_secrets_file not in _credentials:
+        flow = InstalledAppFlow.from_client_secrets_file(
+            client_secrets_file, FORMS_SCOPES
         )
+        _credentials[client_secrets_file] = flow.run_local_server(port=0)
+    return _credentials[client_secrets_file]
 
-    return forms_info
+
+@contextmanager
+def forms_service(creds):
+    """Check out a Google Forms API service authorized with ``creds`` for the
+    duration of the ``with`` block.
+
+    Services (and their authorized http) aren't thread-safe, so a service is only used
+    by one thread at a time. Once the block ends, it goes back to a module-level pool
+    (per credentials), so later blocks, in any thread and any ``dataframe_to_form``
+    call, reuse it instead of building a new one.
+    """
+    with _idle_forms_services_lock:
+        # credentials hash by identity (and are kept alive by this key)
+        idle_services = _idle_forms_services.setdefault(creds, queue.SimpleQueue())
+    try:
+        service = idle_services.get_nowait()
+    except queue.Empty:
+        service = _build_forms_service(creds)
+    try:
+        yield service
+    finally:
+        idle_services.put(service)
+
+
+def _build_forms_service(creds):
+    try:
+        # Use the discovery document shipped with googleapiclient (no HTTP request)
+        return build('forms', 'v1', credentials=creds, static_discovery=True)
+    except UnknownApiNameOrVersion:
+        # This googleapiclient version doesn't ship it, so fetch it once and keep it
+        return build(
+            'forms',
+            'v1',
+            credentials=creds,
+            static_discovery=False,
+            cache_discovery=True,
+            cache=DiscoveryFileCache(),
+        )
+
+
+class DiscoveryFileCache(Cache):
+    """A discovery document cache that persists documents as files in ``rootdir``."""
+
+    def __init__(self, rootdir: str = os.path.join(DFLT_CACHE_DIR, 'discovery')):
+        self.rootdir = rootdir
+
+    def _filepath(self, url):
+        return os.path.join(self.rootdir, hashlib.sha1(url.encode()).hexdigest())
+
+    def get(self, url):
+        try:
+            with open(self._filepath(url)) as fp:
+                return fp.read()
+        except OSError:
+            return None
+
+    def set(self, url, content):
+        os.makedirs(self.rootdir, exist_ok=True)
+        with open(self._filepath(url), 'w') as fp:
+            fp.write(content)
+
+
+def _batch_execute(
+    service,
+    requests,
+    *,
+    batch_size: int = DFLT_BATCH_SIZE,
+    max_tries: int = DFLT_MAX_TRIES,
+):
+    """Execute the ``requests`` as multipart HTTP batches of up to ``batch_size`` calls.
+
+    Batches, and calls within them, failing with one of the ``RETRIABLE_STATUSES`` are
+    retried with jittered exponential backoff, up to ``max_tries`` times.
+
+    Returns the responses in the same order as ``requests``.
+    Raises the first other error encountered, after the batch it belongs to completed.
+    """
+    responses = [None] * len(requests)
+    pending = list(range(len(requests)))
+
+    for attempt in range(max_tries):
+        to_retry = []
+        errors = []
+
+        def callback(request_id, response, exception):
+            if exception is None:
+                responses[int(request_id)] = response
+            elif _is_retriable(exception) and attempt < max_tries - 1:
+                to_retry.append(int(request_id))
+            else:
+                errors.append(exception)
+
+        for batch_start in range(0, len(pending), batch_size):
+            batch = service.new_batch_http_request(callback=callback)
+            for i in pending[batch_start : batch_start + batch_size]:
+                batch.add(requests[i], request_id=str(i))
+            _execute_with_retry(batch, max_tries=max_tries)
+            if errors:
+                raise errors[0]
+
+        if not to_retry:
+            break
+        time.sleep(backoff_seconds(attempt))
+        pending = sorted(to_retry)
+
+    return responses
+
+
+_in_flight_requests = threading.BoundedSemaphore(DFLT_MAX_IN_FLIGHT)
+
+
+def _execute_with_retry(request, *, max_tries: int = DFLT_MAX_TRIES):
+    """Execute ``request``, retrying with backoff if it fails with a retriable status.
+
+    At most ``DFLT_MAX_IN_FLIGHT`` requests are executed at the same time.
+    """
+    for attempt in range(max_tries):
+        try:
+            with _in_flight_requests:
+                return request.execute()
+        except HttpError as e:
+            if not _is_retriable(e) or attempt == max_tries - 1:
+                raise
+        time.sleep(backoff_seconds(attempt))
+
+
+def _is_retriable(exception) -> bool:
+    return (
+        isinstance(exception, HttpError) and exception.resp.status in RETRIABLE_STATUSES
+    )
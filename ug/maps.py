@@ -1,8 +1,13 @@
 """Google Maps tools."""
 
 import time
+import asyncio
+import hashlib
 import itertools
-from functools import partial
+import threading
+from functools import partial, lru_cache
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import (
     Any,
     Dict,
@@ -15,20 +20,47 @@ from typing import (
     KT,
     Iterable,
     Iterator,
+    AsyncIterator,
     TypeVar,
     MutableMapping,
+    Sequence,
 )
 from lkj import print_progress
+from googlemaps.exceptions import ApiError, HTTPError
 
 from ug.util import (
     ensure_gmaps_client,
     ClientSpec,
     DFLT_GOOGLE_API_KEY_ENV_VAR,
+    DFLT_CACHE_DIR,
     KvWriterSpec,
     ensure_kv_writer,
+    RateLimiter,
+    rate_limited_client,
+    backoff_seconds,
+    DiskCache,
+    json_loads,
 )
 
 DFLT_RADIUS_IN_METERS = 50000  # in meters
+DFLT_MAX_WORKERS = 8  # number of locations searched concurrently
+DFLT_MAX_REQUESTS_PER_SECOND = 10  # to stay under the Google Maps APIs QPS quota
+MIN_SECONDS_BETWEEN_PROGRESS_PRINTS = 0.25  # terminal flushes aren't free
+# Delays before successive tries of a next page request: its page token takes a
+# (short and variable) time to become valid
+PAGE_TOKEN_RETRY_DELAYS = (0.3, 0.6, 1.2, 2.4)
+# Requests failing with these (transient) HTTP statuses are retried, with backoff
+RETRIABLE_HTTP_STATUSES = (429, 500, 502, 503, 504)
+DFLT_MAX_TRIES = 5
+MAX_BACKOFF_SECONDS = 30
+# Queries (at a same location) whose embeddings are at least this (cosine) similar
+# share their search results, if search_maps is asked to (semantic_cache=True)
+DFLT_SEMANTIC_CACHE_THRESHOLD = 0.92
+DFLT_EMBEDDING_MODEL = 'all-MiniLM-L6-v2'  # a small (sentence-transformers) model
+# Bounds of its memory: the searches of the most recently used places are kept, and
+# the most recent ones of each place
+DFLT_SEMANTIC_CACHE_MAX_PLACES = 1024
+DFLT_SEMANTIC_CACHE_MAX_SEARCHES_PER_PLACE = 64
 
 
 LocationsSource = TypeVar('LocationsSource')
@@ -41,7 +73,27 @@ def identity(x):
 
 from typing import Union, List
 from typing_extensions import Literal
-from urllib.parse import urlencode
+from urllib.parse import urlencode, quote_plus
+from numbers import Real
+from types import MappingProxyType
+
+# Map types and layers, as coded in google maps urls
+_MAPTYPE_MAPPING = MappingProxyType(
+    {
+        'roadmap': 'm',
+        'satellite': 'k',
+        'hybrid': 'h',
+        'terrain': 'p',
+        'google_earth': 'e',
+    }
+)
+_LAYER_MAPPING = MappingProxyType(
+    {
+        'bicycling': 'c',
+        'traffic': 't',
+        'transit': 'p',
+    }
+)
 
 
 def google_maps_url(
@@ -97,35 +149,41 @@ def google_maps_url(
         >>> google_maps_url('some address', street_view=True, heading=90)
         'https://www.google.com/maps?q=some+address&z=15&t=m&cbll=some+address&cbp=12,90,0,0,5,0'
     """
-    if isinstance(query, (tuple, list)) and len(query) == 2:
-        query = f"{query[0]},{query[1]}"
-    elif isinstance(query, dict):
-        if 'lat' in query and 'lon' in query:
-            query = f"{query['lat']},{query['lon']}"
-        elif 'latitude' in query and 'longitude' in query:
-            query = f"{query['latitude']},{query['longitude']}"
-        else:
-            raise ValueError(
-                "Invalid dictionary format for query: must contain 'lat' and 'lon' keys."
-            )
-    elif not isinstance(query, str):
-        raise ValueError(
-            f"Query must be a string, tuple, list, or dictionary. Was: {query}"
+    query = _query_string(query)
+
+    # Fast path for the common case of a plain map view of the query
+    if not (
+        origin
+        or destination
+        or travelmode
+        or waypoints
+        or place_id
+        or street_view
+        or language
+        or embed
+        or iwloc
+        or layer
+    ):
+        # same quoting as the urlencode of the general case
+        return (
+            'https://www.google.com/maps'
+            f"?q={quote_plus(query, safe=',|')}"
+            f"&z={quote_plus(str(zoom), safe=',|')}"
+            f"&t={_MAPTYPE_MAPPING.get(maptype, 'm')}"
+        )
+    # Fast path for the common case of plain directions from origin to destination
+    if (
+        origin
+        and destination
+        and travelmode
+        and not (waypoints or language or embed or iwloc)
+    ):
+        return (
+            'https://www.google.com/maps/dir/?api=1'
+            f"&origin={quote_plus(origin, safe=',|')}"
+            f"&destination={quote_plus(destination, safe=',|')}"
+            f"&travelmode={quote_plus(travelmode, safe=',|')}"
         )
-
-    # Map types and layers
-    maptype_mapping = {
-        'roadmap': 'm',
-        'satellite': 'k',
-        'hybrid': 'h',
-        'terrain': 'p',
-        'google_earth': 'e',
-    }
-    layer_mapping = {
-        'bicycling': 'c',
-        'traffic': 't',
-        'transit': 'p',
-    }
 
     # Construct parameters
     params = {}
@@ -147,9 +205,9 @@ def google_maps_url(
         else:
             params['q'] = query
             params['z'] = str(zoom)
-            params['t'] = maptype_mapping.get(maptype, 'm')
+            params['t'] = _MAPTYPE_MAPPING.get(maptype, 'm')
             if layer:
-                params['layer'] = layer_mapping.get(layer)
+                params['layer'] = _LAYER_MAPPING.get(layer)
             if street_view:
                 params['cbll'] = query
                 cbp_params = ['12']
@@ -170,6 +228,70 @@ def google_maps_url(
     return url
 
 
+def _query_string(query: Union[str, tuple, list, dict]) -> str:
+    if isinstance(query, (tuple, list)) and len(query) == 2:
+        query = f"{query[0]},{query[1]}"
+    elif isinstance(query, dict):
+        if 'lat' in query and 'lon' in query:
+            query = f"{query['lat']},{query['lon']}"
+        elif 'latitude' in query and 'longitude' in query:
+            query = f"{query['latitude']},{query['longitude']}"
+        else:
+            raise ValueError(
+                "Invalid dictionary format for query: must contain 'lat' and 'lon' keys."
+            )
+    elif not isinstance(query, str):
+        raise ValueError(
+            f"Query must be a string, tuple, list, or dictionary. Was: {query}"
+        )
+    return query
+
+
+def google_maps_urls_bulk(
+    queries: Iterable[Union[str, tuple, list, dict]],
+    *,
+    zoom: int = 15,
+    maptype: Literal[
+        'roadmap', 'satellite', 'hybrid', 'terrain', 'google_earth'
+    ] = 'roadmap',
+) -> List[str]:
+    """
+    Generate the Google Maps (plain map view) URLs of many queries at once.
+
+    Gives the same URLs as ``google_maps_url`` with only ``zoom`` and ``maptype``,
+    but shares the work common to all queries. Queries can also be any
+    ``(lat, lon)`` pair of numbers, like the rows of a numpy array.
+
+    Examples:
+        >>> google_maps_urls_bulk([(43.5300401, 5.4229452), 'some address'], zoom=16)  # doctest: +NORMALIZE_WHITESPACE
+        ['https://www.google.com/maps?q=43.5300401,5.4229452&z=16&t=m',
+         'https://www.google.com/maps?q=some+address&z=16&t=m']
+    """
+    prefix = 'https://www.google.com/maps?q='
+    suffix = (
+        f"&z={quote_plus(str(zoom), safe=',|')}"
+        f"&t={_MAPTYPE_MAPPING.get(maptype, 'm')}"
+    )
+
+    def query_string(query):
+        if isinstance(query, str):
+            return quote_plus(query, safe=',|')
+        if not isinstance(query, dict):
+            try:
+                lat, lon = query
+            except (TypeError, ValueError):
+                pass  # not a pair: _query_string raises the right error
+            else:
+                if isinstance(lat, Real) and isinstance(lon, Real):
+                    latlon = f"{lat},{lon}"
+                    # Formatted numbers only need quoting for exponents' plus signs
+                    if '+' not in latlon:
+                        return latlon
+        return quote_plus(_query_string(query), safe=',|')
+
+    return [prefix + query_string(query) + suffix for query in queries]
+
+
 def acquire_maps_search_results_from_different_locations(
     search_query: str,
     locations: Iterable[LocationsSource],
@@ -181,6 +303,11 @@ def acquire_maps_search_results_from_different_locations(
     raise_on_error: bool = True,
     start_index: int = 0,
     stop_index: Optional[int] = None,
+    gmaps_client: ClientSpec = DFLT_GOOGLE_API_KEY_ENV_VAR,
+    max_workers: int = DFLT_MAX_WORKERS,
+    max_requests_per_second: float = DFLT_MAX_REQUESTS_PER_SECOND,
+    print_every: int = 1,
+    use_asyncio: bool = False,
 ) -> list:
     """
     Acquire search results from different locations and store them.
@@ -190,6 +317,9 @@ def acquire_maps_search_results_from_different_locations(
     function. Users need to provide this function. Users may want to check out the
     `dol` package and ecosystem for tools to make storing functions.
 
+    Repeated locations are only searched once, their results being saved under the
+    key of each of their sources.
+
     Parameters:
         search_query (str): The search term to query on Google Maps.
         locations (Iterable[LocationsSource]): The locations to search at.
@@ -200,40 +330,173 @@ def acquire_maps_search_results_from_different_locations(
         raise_on_error (bool): Whether to raise an error if an exception occurs.
         start_index (Optional[int]): The index to start at (inclusive).
         stop_index (Optional[int]): The index to stop at (exclusive).
+        gmaps_client (optional): The Google Maps client (or API key) shared by all searches.
+        max_workers (int): The number of locations searched concurrently.
+        max_requests_per_second (float): The maximum rate of Google Maps API requests
+            (geocoding and places pages alike), across all searches.
+        print_every (int): Print progress every so many saved results (at most every
+            MIN_SECONDS_BETWEEN_PROGRESS_PRINTS seconds, and for the last one).
+        use_asyncio (bool): Whether to search on an asyncio event loop (with aiohttp)
+            instead of threads, `max_workers` then being the number of concurrent
+            searches. Can't be used when an event loop is already running (e.g. in a
+            notebook): await `acquire_maps_search_results_from_different_locations_async`
+            there instead.
 
     """
+    if use_asyncio:
+        return asyncio.run(
+            acquire_maps_search_results_from_different_locations_async(
+                search_query,
+                locations,
+                save_result=save_result,
+                get_location=get_location,
+                get_key=get_key,
+                radius_in_meters=radius_in_meters,
+                raise_on_error=raise_on_error,
+                start_index=start_index,
+                stop_index=stop_index,
+                gmaps_client=gmaps_client,
+                max_concurrent_searches=max_workers,
+                max_requests_per_second=max_requests_per_second,
+                print_every=print_every,
+            )
+        )
+
     save_result = ensure_kv_writer(save_result)
     if get_key is None:
         get_key = get_location  # use the location as the key
 
-    single_line_print = partial(print_progress, refresh=True)
-
     locations = itertools.islice(locations, start_index, stop_index)
 
-    def search_results_gen():
-        location = None  # just to avoid UnboundLocalError
-        for i, location_src in enumerate(locations):
-            try:
-                location = get_location(location_src)  # extract location
-                key = get_key(location_src)  # extract key
-                single_line_print(f"{i:04.0f}: {key}" + " " * 30)
-                # search the query at that location
-                r = search_maps(
-                    search_query, location, radius_in_meters=radius_in_meters
-                )
-                save_result(key, r)  # save the results
-            except Exception as e:
-                if raise_on_error:
-                    raise
-                yield dict(i=i, search_query=search_query, location=location, e=e)
-                print(f"ERROR: {e}")
+    # The searches' requests overlap, but can't exceed the rate limit all together
+    gmaps_client = _rate_limited_gmaps_client(
+        ensure_gmaps_client(gmaps_client), max_requests_per_second
+    )
 
-    errors = list(search_results_gen())
+    def search(location):
+        return search_maps(
+            search_query,
+            location,
+            radius_in_meters=radius_in_meters,
+            gmaps_client=gmaps_client,
+        )
+
+    errors = []
+
+    def register_error(i, location, e):
+        errors.append(dict(i=i, search_query=search_query, location=location, e=e))
+        print(f"ERROR: {e}")
+
+    # All locations and keys are extracted before any search is submitted, so that
+    # (with raise_on_error) an extraction error doesn't discard searches' results
+    sources = _extract_sources(
+        locations, get_location, get_key, raise_on_error, register_error
+    )
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {}  # search future -> (i, key, location) of the sources it's for
+        searches = {}  # location -> its search future
+        for i, key, location in sources:
+            # search the query at that location (only once for repeated locations)
+            location_id = _location_id(location)
+            if location_id not in searches:
+                searches[location_id] = future = executor.submit(search, location)
+                futures[future] = []
+            futures[searches[location_id]].append((i, key, location))
+
+        # save the results from this thread, so save_result needn't be thread-safe
+        n_locations = len(sources)
+        print_saved = _progress_printer(n_locations, print_every)
+        for future in as_completed(futures):
+            for i, key, location in futures[future]:
+                print_saved(i, key)
+                try:
+                    r = future.result()
+                    save_result(key, r)  # save the results
+                except Exception as e:
+                    if raise_on_error:
+                        raise
+                    register_error(i, location, e)
+    finally:
+        # cancel the searches still pending (which only happens if we're raising)
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    errors.sort(key=lambda error: error['i'])
     print(f"Number of errors: {len(errors)}")
 
     return errors
 
 
+@lru_cache(maxsize=8)
+def _rate_limited_gmaps_client(gmaps_client, max_requests_per_second: float):
+    # The same one for all acquisitions with the same client (and rate), so that they
+    # share its geocoding memo (keyed by client), and its quota
+    return rate_limited_client(gmaps_client, RateLimiter(max_requests_per_second))
+
+
+def _extract_sources(
+    locations, get_location, get_key, raise_on_error: bool, register_error
+):
+    """The ``(i, key, location)`` of each of the ``locations`` sources, those whose
+    location or key couldn't be extracted being (raised, or) registered as errors.
+    """
+    sources = []
+    for i, location_src in enumerate(locations):
+        location = None  # just to avoid UnboundLocalError
+        try:
+            location = get_location(location_src)  # extract location
+            key = get_key(location_src)  # extract key
+        except Exception as e:
+            if raise_on_error:
+                raise
+            register_error(i, location, e)
+            continue
+        sources.append((i, key, location))
+    return sources
+
+
+def _progress_printer(n_locations: int, print_every: int = 1):
+    """Make the function to call with the ``(i, key)`` of each of the ``n_locations``
+    saved, printing them every ``print_every`` calls, but at most every
+    MIN_SECONDS_BETWEEN_PROGRESS_PRINTS seconds (and always for the last one).
+    """
+    single_line_print = partial(print_progress, refresh=True)
+    n_done = 0
+    last_print_time = 0.0
+
+    def print_saved(i, key):
+        nonlocal n_done, last_print_time
+        n_done += 1
+        if n_done % print_every and n_done != n_locations:
+            return  # skipped without formatting, or even looking at the time
+        now = time.monotonic()
+        if n_done == n_locations or (
+            now - last_print_time >= MIN_SECONDS_BETWEEN_PROGRESS_PRINTS
+        ):
+            single_line_print(f"{i:04.0f}: {key}" + " " * 30)
+            last_print_time = now
+
+    return print_saved
+
+
+def _location_id(location):
+    """What identifies a location, so that repeated ones are only searched once.
+
+    That's the location itself if it's hashable, and its (type and) repr otherwise.
+
+    >>> _location_id((43.5, 5.4))
+    (43.5, 5.4)
+    >>> _location_id([43.5, 5.4])
+    (<class 'list'>, '[43.5, 5.4]')
+    """
+    try:
+        hash(location)
+    except TypeError:
+        return (type(location), repr(location))
+    return location
+
+
 def search_maps(
     query: str,
     center_location: Union[str, Tuple[float, float], List[float]],
@@ -242,6 +505,10 @@ def search_maps(
     gmaps_client: ClientSpec = DFLT_GOOGLE_API_KEY_ENV_VAR,
     n_results: int = 10,
     seconds_between_requests: int = 2,
+    disk_cache_dir: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    use_cache: bool = False,
+    semantic_cache: bool = False,
 ) -> List[Dict[str, Any]]:
     """
     Retrieves the top `n_results` from Google Maps for a given search query and location.
@@ -254,7 +521,21 @@ def search_maps(
         radius_in_meters (int): The search radius in meters (default is 50,000).
         gmaps_client (optional): An instance of the Google Maps client. If None, a new client will be created.
         n_results (int): The number of top results to return (default is 10).
-        seconds_between_requests (int): Seconds to wait between paginated requests (default is 2).
+        seconds_between_requests (int): The maximum number of seconds of each wait
+            before requesting a next page, while Google doesn't accept its page token
+            yet (default is 2).
+        disk_cache_dir (Optional[str]): If given, the folder where geocoding results are persisted.
+        fields (Optional[Sequence[str]]): If given, only these fields of the results are kept.
+        use_cache (bool): Whether to persist the result pages (in the `'places'` store of
+            `disk_cache_dir`, or of DFLT_CACHE_DIR if not given), and reuse them for
+            the same query, location (to 4 decimals) and radius. Off by default, since
+            places change: stale results are for exploration, not for fresh data.
+        semantic_cache (bool): Whether to reuse (from memory) the results of a previous
+            search at the same location, radius and fields, whose query means about the
+            same (as measured by DFLT_EMBEDDING_MODEL embeddings, with a cosine of at
+            least DFLT_SEMANTIC_CACHE_THRESHOLD), instead of searching. Off by default,
+            since then the results may be those of another query. Needs
+            `sentence-transformers`.
 
     Returns:
         List[Dict[str, Any]]: A list of dictionaries containing details about each place.
@@ -301,26 +582,18 @@ def search_maps(
     """
 
     gmaps_client = ensure_gmaps_client(gmaps_client)
+    radius_in_meters = int(radius_in_meters)  # once, for the cache key and requests
 
     # Determine the coordinates for the specified location
-    if isinstance(center_location, str):
-        # Geocode the city name to get coordinates
-        geocode_result = gmaps_client.geocode(center_location)
-        if geocode_result:
-            location = geocode_result[0]['geometry']['location']
-            location_coords = (location['lat'], location['lng'])
-        else:
-            raise ValueError(f"Could not find location for: {center_location}")
-    elif isinstance(center_location, (tuple, list)) and len(center_location) == 2:
-        # Use the provided coordinates directly
-        try:
-            location_coords = (float(center_location[0]), float(center_location[1]))
-        except (ValueError, TypeError):
-            raise ValueError("Coordinates must be numeric values.")
-    else:
-        raise TypeError(
-            "center_location must be a string (city name) or a tuple/list of (latitude, longitude)."
+    coerce = _COORD_DISPATCH.get(type(center_location), _coerce_any)
+    location_coords = coerce(gmaps_client, center_location, disk_cache_dir)
+
+    if semantic_cache:
+        similar_query_results = _semantic_search_cache.get(
+            query, location_coords, radius_in_meters, fields, n_results
         )
+        if similar_query_results is not None:
+            return similar_query_results
 
     # Use the generator function to fetch results
     result_generator = maps_paged_results(
@@ -329,14 +602,183 @@ def search_maps(
         radius_in_meters=radius_in_meters,
         gmaps_client=gmaps_client,
         seconds_between_requests=seconds_between_requests,
+        max_results=n_results,
+        fields=fields,
     )
+    if use_cache:
+        result_generator = _cached_pages(
+            DiskCache(disk_cache_dir or DFLT_CACHE_DIR, 'places'),
+            _places_cache_key(query, location_coords, radius_in_meters, fields),
+            result_generator,
+            n_results,
+        )
+
+    # Gather results up to n_results, requesting no page once we have them
+    results = []
+    for page in result_generator:
+        results.extend(page)
+        if len(results) >= n_results:
+            break
+
+    results = results[:n_results]
+    if semantic_cache:
+        _semantic_search_cache.add(
+            query, location_coords, radius_in_meters, fields, n_results, results
+        )
+    return results
+
 
-    # Gather results up to n_results
-    results = list(
-        itertools.islice(itertools.chain.from_iterable(result_generator), n_results)
+def _places_cache_key(query, location_coords, radius_in_meters, fields=None) -> str:
+    """Key of the cached results of a search, the same for nearby locations.
+
+    >>> key = _places_cache_key('yoga', (43.529742, 5.447427), 3000)
+    >>> key == _places_cache_key('yoga', (43.52974, 5.44743), 3000)
+    True
+    >>> key == _places_cache_key('yoga', (43.52974, 5.44743), 3000, fields=['name'])
+    False
+    """
+    lat, lng = location_coords
+    key = f'{query}|{round(lat, 4)},{round(lng, 4)}|{radius_in_meters}'
+    if fields is not None:
+        key += '|' + ','.join(fields)
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def _cached_pages(cache, key, pages, n_results):
+    """Yield the pages cached under `key` if they're enough for `n_results`, and
+    otherwise those of `pages`, caching them."""
+    cached = cache.get(key)
+    if cached is not None and (
+        sum(map(len, cached['pages'])) >= n_results
+        # fewer results than wanted when cached means there were no more
+        or sum(map(len, cached['pages'])) < cached['n_results']
+    ):
+        yield from cached['pages']
+        return
+    # pages stops requesting once it has n_results, so this doesn't fetch more
+    pages = list(pages)
+    cache[key] = dict(pages=pages, n_results=n_results)
+    yield from pages
+
+
+class _SemanticSearchCache:
+    """In-memory search results, to reuse for queries similar to theirs.
+
+    Queries are only compared to those searched at the same location (to 4 decimals),
+    radius and fields, by the cosine similarity of their (normalized) embeddings.
+    Only the last ``max_searches_per_place`` searches of the last ``max_places``
+    (used) places are kept.
+    """
+
+    def __init__(
+        self,
+        model_name: str = DFLT_EMBEDDING_MODEL,
+        threshold: float = DFLT_SEMANTIC_CACHE_THRESHOLD,
+        max_places: int = DFLT_SEMANTIC_CACHE_MAX_PLACES,
+        max_searches_per_place: int = DFLT_SEMANTIC_CACHE_MAX_SEARCHES_PER_PLACE,
+    ):
+        self.model_name = model_name
+        self.threshold = threshold
+        self.max_places = max_places
+        self.max_searches_per_place = max_searches_per_place
+        self._model = None
+        # (location, radius, fields) -> (stacked) query embeddings, and their
+        # searches' (n_results, results), from least to most recently used place
+        self._searches = OrderedDict()
+        self._lock = threading.Lock()
+        # get and add (on a miss) need the embedding of the same query
+        self._embedding = lru_cache(maxsize=1024)(self._compute_embedding)
+
+    def _compute_embedding(self, query: str):
+        with self._lock:
+            if self._model is None:
+                from sentence_transformers import SentenceTransformer
+
+                self._model = SentenceTransformer(self.model_name)
+        return self._model.encode(query, normalize_embeddings=True)
+
+    @staticmethod
+    def _place_key(location_coords, radius_in_meters, fields):
+        lat, lng = location_coords
+        fields = None if fields is None else tuple(fields)
+        return (round(lat, 4), round(lng, 4), radius_in_meters, fields)
+
+    def get(self, query, location_coords, radius_in_meters, fields, n_results):
+        """The results of the most similar query, if similar enough (else None)."""
+        import numpy as np
+
+        place_key = self._place_key(location_coords, radius_in_meters, fields)
+        with self._lock:
+            if place_key not in self._searches:
+                return None
+            self._searches.move_to_end(place_key)
+            # (replaced, never mutated, by add: safe to use outside of the lock)
+            embeddings, searches = self._searches[place_key]
+        similarities = embeddings @ self._embedding(query)
+        # Only the searches that asked for enough results (or got all there were)
+        has_enough = [n >= n_results or len(r) < n for n, r in searches]
+        similarities[np.logical_not(has_enough)] = -1
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.threshold:
+            return searches[best][1][:n_results]
+        return None
+
+    def add(self, query, location_coords, radius_in_meters, fields, n_results, results):
+        import numpy as np
+
+        place_key = self._place_key(location_coords, radius_in_meters, fields)
+        embedding = self._embedding(query)
+        keep = self.max_searches_per_place - 1  # the searches kept, besides this one
+        with self._lock:
+            embeddings, searches = self._searches.pop(place_key, ((), ()))
+            self._searches[place_key] = (
+                np.stack([*embeddings[len(embeddings) - keep :], embedding]),
+                (*searches[len(searches) - keep :], (n_results, list(results))),
+            )
+            if len(self._searches) > self.max_places:
+                self._searches.popitem(last=False)  # the least recently used place
+
+
+_semantic_search_cache = _SemanticSearchCache()
+
+
+def _latlon_of_sequence(center_location) -> Tuple[float, float]:
+    if isinstance(center_location, (tuple, list)) and len(center_location) == 2:
+        lat, lng = center_location
+        if type(lat) is float and type(lng) is float:
+            return (lat, lng)  # the usual case, so skip the coercions
+        try:
+            return (float(lat), float(lng))
+        except (ValueError, TypeError):
+            raise ValueError("Coordinates must be numeric values.")
+    raise TypeError(
+        "center_location must be a string (city name) or a tuple/list of (latitude, longitude)."
     )
 
-    return results
+
+def _coerce_str(gmaps_client, center_location, disk_cache_dir=None):
+    # Geocode the city name to get coordinates
+    return _geocode_latlon(gmaps_client, center_location, disk_cache_dir)
+
+
+def _coerce_seq(gmaps_client, center_location, disk_cache_dir=None):
+    # Use the provided coordinates directly
+    return _latlon_of_sequence(center_location)
+
+
+def _coerce_any(gmaps_client, center_location, disk_cache_dir=None):
+    # Subclasses (e.g. namedtuples) and invalid types (a TypeError) end up here
+    if isinstance(center_location, str):
+        return _coerce_str(gmaps_client, center_location, disk_cache_dir)
+    return _coerce_seq(gmaps_client, center_location, disk_cache_dir)
+
+
+# How search_maps gets coordinates from its center_location, by (exact) type
+_COORD_DISPATCH = {
+    str: _coerce_str,
+    tuple: _coerce_seq,
+    list: _coerce_seq,
+}
 
 
 def maps_paged_results(
@@ -346,6 +788,8 @@ def maps_paged_results(
     *,
     gmaps_client: ClientSpec = DFLT_GOOGLE_API_KEY_ENV_VAR,
     seconds_between_requests: int = 2,
+    max_results: Optional[int] = None,
+    fields: Optional[Sequence[str]] = None,
 ) -> Generator[List[Dict[str, Any]], None, None]:
     """
     Generator function to fetch paged results from the Google Maps API.
@@ -355,49 +799,372 @@ def maps_paged_results(
         location_coords (Tuple[float, float]): Coordinates (latitude, longitude) to bias the search towards.
         radius_in_meters (int): The search radius in meters.
         gmaps_client: An instance of the Google Maps client.
-        seconds_between_requests (int): Seconds to wait between paginated requests.
+        seconds_between_requests (int): The maximum number of seconds of each wait
+            before requesting a next page (pages are requested as soon as Google
+            accepts their page token, polling with PAGE_TOKEN_RETRY_DELAYS).
+        max_results (Optional[int]): If given, no more pages are requested once (at
+            least) this many results were yielded.
+        fields (Optional[Sequence[str]]): If given, only these fields of the results are
+            kept (the text search API has no fields parameter, so this is done here).
 
     Yields:
         List[Dict[str, Any]]: A list of place results from each page.
     """
-    radius_in_meters = int(radius_in_meters)
-    # Initial search request
-    response = gmaps_client.places(
-        query=query,
-        location=location_coords,
-        radius=radius_in_meters,
+    # The arguments common to all page requests, built once
+    places_kwargs = dict(
+        query=query, location=location_coords, radius=int(radius_in_meters)
     )
+    # Initial search request
+    response = _call_with_retry(gmaps_client.places, **places_kwargs)
 
-    yield response.get('results', [])
+    if fields is None:
+        project = identity
+    else:
 
-    # Handle pagination
-    while 'next_page_token' in response:
-        time.sleep(seconds_between_requests)
-        response = gmaps_client.places(
-            query=query,
-            page_token=response['next_page_token'],
-            location=location_coords,
-            radius=radius_in_meters,
+        def project(results):
+            return [{k: r[k] for k in fields if k in r} for r in results]
+
+    results = response.get('results', [])
+    n_yielded = len(results)
+    yield project(results)
+
+    # Handle pagination, as long as more results are wanted
+    while 'next_page_token' in response and (
+        max_results is None or n_yielded < max_results
+    ):
+        response = _next_places_page(
+            gmaps_client,
+            response['next_page_token'],
+            max_delay=seconds_between_requests,
+            **places_kwargs,
         )
-        yield response.get('results', [])
+        results = response.get('results', [])
+        n_yielded += len(results)
+        yield project(results)
+
+
+def _next_places_page(gmaps_client, page_token, *, max_delay, **places_kwargs):
+    """Request the page of ``page_token`` as soon as the token is valid.
+
+    Tries after each of the ``PAGE_TOKEN_RETRY_DELAYS`` (capped to ``max_delay``),
+    as long as Google answers that the token isn't valid (yet).
+    """
+    for i, delay in enumerate(PAGE_TOKEN_RETRY_DELAYS, 1):
+        time.sleep(min(delay, max_delay))
+        try:
+            return _call_with_retry(
+                gmaps_client.places, page_token=page_token, **places_kwargs
+            )
+        except ApiError as e:
+            if e.status != 'INVALID_REQUEST' or i == len(PAGE_TOKEN_RETRY_DELAYS):
+                raise
+
+
+def _call_with_retry(func, *args, max_tries: int = DFLT_MAX_TRIES, **kwargs):
+    """Call ``func(*args, **kwargs)``, retrying with backoff if it fails with a
+    retriable status."""
+    for attempt in range(max_tries):
+        try:
+            return func(*args, **kwargs)
+        except (HTTPError, ApiError) as e:
+            if not _is_retriable(e) or attempt == max_tries - 1:
+                raise
+        time.sleep(backoff_seconds(attempt, MAX_BACKOFF_SECONDS))
+
+
+def _is_retriable(exception) -> bool:
+    if isinstance(exception, HTTPError):
+        return exception.status_code in RETRIABLE_HTTP_STATUSES
+    # which googlemaps clients retry themselves, but _AsyncMapsClient doesn't
+    return isinstance(exception, ApiError) and exception.status == 'OVER_QUERY_LIMIT'
 
 
 def get_latlon(
     query: str,
     *,
     gmaps_client: ClientSpec = DFLT_GOOGLE_API_KEY_ENV_VAR,
+    disk_cache_dir: Optional[str] = None,
 ) -> Tuple[float, float]:
     """
     Get the latitude and longitude for a given query (address, city, etc.).
+
+    Results are cached in memory and, if ``disk_cache_dir`` is given, persisted there.
     """
     gmaps_client = ensure_gmaps_client(gmaps_client)
+    return _geocode_latlon(gmaps_client, query, disk_cache_dir)
 
-    geocode_result = gmaps_client.geocode(query)
+
+def _geocode_latlon(
+    gmaps_client, query: str, disk_cache_dir: Optional[str] = None
+) -> Tuple[float, float]:
+    latlon = _cached_geocode_latlon(
+        gmaps_client, _normalize_geocode_query(query), disk_cache_dir
+    )
+    if latlon is None:
+        raise ValueError(f"Could not find location for: {query}")
+    return latlon
+
+
+def _normalize_geocode_query(query: str) -> str:
+    """So that queries only differing by case or whitespace share cache entries.
+
+    >>> _normalize_geocode_query('  Aix-en-Provence, \tFrance ')
+    'aix-en-provence, france'
+    """
+    return ' '.join(query.split()).lower()
+
+
+@lru_cache(maxsize=4096)
+def _cached_geocode_latlon(
+    gmaps_client, query: str, disk_cache_dir: Optional[str] = None
+) -> Optional[Tuple[float, float]]:
+    # googlemaps clients hash by identity, so the memory cache is per client
+    disk_cache = DiskCache(disk_cache_dir, 'geocode') if disk_cache_dir else {}
+    if (latlon := disk_cache.get(query)) is not None:
+        return latlon
+
+    geocode_result = _call_with_retry(gmaps_client.geocode, query)
     if geocode_result:
         location = geocode_result[0]['geometry']['location']
-        return location['lat'], location['lng']
+        latlon = disk_cache[query] = (location['lat'], location['lng'])
+        return latlon
+    # Not found: None is cached in memory (but not persisted)
+    return None
+
+
+# -------------------------------------------------------------------------------------
+# Async acquisition
+#
+# The googlemaps package has no async client, so the async searches call the (GET,
+# JSON) web service endpoints directly, with aiohttp.
+
+PLACES_TEXT_SEARCH_URL = 'https://maps.googleapis.com/maps/api/place/textsearch/json'
+GEOCODE_URL = 'https://maps.googleapis.com/maps/api/geocode/json'
+DFLT_MAX_CONNECTIONS = 64  # size of the pool of connections the searches share
+
+
+async def acquire_maps_search_results_from_different_locations_async(
+    search_query: str,
+    locations: Iterable[LocationsSource],
+    *,
+    save_result: KvWriterSpec,
+    get_location: Callable[[LocationsSource], Location] = identity,
+    get_key: Optional[Callable[[LocationsSource], KT]] = None,
+    radius_in_meters: int = DFLT_RADIUS_IN_METERS,
+    raise_on_error: bool = True,
+    start_index: int = 0,
+    stop_index: Optional[int] = None,
+    gmaps_client: ClientSpec = DFLT_GOOGLE_API_KEY_ENV_VAR,
+    max_concurrent_searches: int = DFLT_MAX_WORKERS,
+    max_requests_per_second: float = DFLT_MAX_REQUESTS_PER_SECOND,
+    print_every: int = 1,
+) -> list:
+    """
+    Async version of `acquire_maps_search_results_from_different_locations`.
+
+    All searches run on the event loop, sharing one aiohttp session (so one pool of
+    at most DFLT_MAX_CONNECTIONS connections), with at most `max_concurrent_searches`
+    of them in progress. The other parameters, and the returned list of errors, are
+    those of the sync version (which runs this one if given `use_asyncio=True`).
+
+    Requires `aiohttp`.
+    """
+    import aiohttp
+
+    save_result = ensure_kv_writer(save_result)
+    if get_key is None:
+        get_key = get_location  # use the location as the key
+
+    locations = itertools.islice(locations, start_index, stop_index)
+
+    errors = []
+
+    def register_error(i, location, e):
+        errors.append(dict(i=i, search_query=search_query, location=location, e=e))
+        print(f"ERROR: {e}")
+
+    # All locations and keys are extracted before any search is started, so that
+    # (with raise_on_error) an extraction error doesn't discard searches' results
+    sources = _extract_sources(
+        locations, get_location, get_key, raise_on_error, register_error
+    )
+
+    semaphore = asyncio.Semaphore(max_concurrent_searches)
+    connector = aiohttp.TCPConnector(limit=DFLT_MAX_CONNECTIONS)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        client = _AsyncMapsClient(
+            session,
+            ensure_gmaps_client(gmaps_client).key,
+            RateLimiter(max_requests_per_second),
+        )
+
+        async def search(location_id, location):
+            async with semaphore:
+                try:
+                    result = await _search_maps_async(
+                        search_query, location, radius_in_meters, client=client
+                    )
+                except Exception as e:
+                    result = e
+            return location_id, result
+
+        tasks = []
+        try:
+            searches = {}  # location -> (i, key, location) of the sources it's for
+            for i, key, location in sources:
+                # search the query at that location (only once for repeated locations)
+                location_id = _location_id(location)
+                if location_id not in searches:
+                    searches[location_id] = []
+                    tasks.append(asyncio.create_task(search(location_id, location)))
+                searches[location_id].append((i, key, location))
+
+            n_locations = len(sources)
+            print_saved = _progress_printer(n_locations, print_every)
+            for task in asyncio.as_completed(tasks):
+                location_id, r = await task
+                for i, key, location in searches[location_id]:
+                    print_saved(i, key)
+                    try:
+                        if isinstance(r, Exception):
+                            raise r
+                        save_result(key, r)  # save the results
+                    except Exception as e:
+                        if raise_on_error:
+                            raise
+                        register_error(i, location, e)
+        finally:
+            # cancel the searches still pending (which only happens if we're raising)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    errors.sort(key=lambda error: error['i'])
+    print(f"Number of errors: {len(errors)}")
+
+    return errors
+
+
+class _AsyncMapsClient:
+    """The few Google Maps web service calls that the async searches need."""
+
+    def __init__(self, session, key: str, rate_limiter: RateLimiter):
+        self.session = session
+        self.key = key
+        self.rate_limiter = rate_limiter
+        # normalized query -> geocoding task, so concurrent searches share them
+        self._geocodings = {}
+
+    async def _get(self, url: str, params: dict) -> dict:
+        # Async version of _call_with_retry
+        for attempt in range(DFLT_MAX_TRIES):
+            try:
+                return await self._get_once(url, params)
+            except (HTTPError, ApiError) as e:
+                if not _is_retriable(e) or attempt == DFLT_MAX_TRIES - 1:
+                    raise
+            await asyncio.sleep(backoff_seconds(attempt, MAX_BACKOFF_SECONDS))
+
+    async def _get_once(self, url: str, params: dict) -> dict:
+        await asyncio.sleep(self.rate_limiter.reserve())
+        async with self.session.get(url, params=dict(params, key=self.key)) as response:
+            if response.status != 200:
+                raise HTTPError(response.status)
+            body = await response.json(loads=json_loads, content_type=None)
+        # same statuses as the googlemaps client's
+        if body['status'] not in ('OK', 'ZERO_RESULTS'):
+            raise ApiError(body['status'], body.get('error_message'))
+        return body
+
+    async def places(self, query, location, radius, page_token=None) -> dict:
+        params = dict(
+            query=query, location=f'{location[0]},{location[1]}', radius=radius
+        )
+        if page_token is not None:
+            params['pagetoken'] = page_token
+        return await self._get(PLACES_TEXT_SEARCH_URL, params)
+
+    async def geocode_latlon(self, query: str) -> Tuple[float, float]:
+        normalized_query = _normalize_geocode_query(query)
+        if normalized_query not in self._geocodings:
+            self._geocodings[normalized_query] = asyncio.ensure_future(
+                self._get(GEOCODE_URL, dict(address=normalized_query))
+            )
+        geocode_result = (await self._geocodings[normalized_query])['results']
+        if not geocode_result:
+            raise ValueError(f"Could not find location for: {query}")
+        location = geocode_result[0]['geometry']['location']
+        return (location['lat'], location['lng'])
+
+
+async def _search_maps_async(
+    query: str,
+    center_location: Union[str, Tuple[float, float], List[float]],
+    radius_in_meters: int = DFLT_RADIUS_IN_METERS,
+    *,
+    client: _AsyncMapsClient,
+    n_results: int = 10,
+    seconds_between_requests: int = 2,
+) -> List[Dict[str, Any]]:
+    """Async version of `search_maps`."""
+    radius_in_meters = int(radius_in_meters)
+    if isinstance(center_location, str):
+        location_coords = await client.geocode_latlon(center_location)
     else:
-        raise ValueError(f"Could not find location for: {query}")
+        location_coords = _latlon_of_sequence(center_location)
+
+    results = []
+    async for page in _maps_paged_results_async(
+        query,
+        location_coords,
+        radius_in_meters,
+        client=client,
+        seconds_between_requests=seconds_between_requests,
+        max_results=n_results,
+    ):
+        results.extend(page)
+    return results[:n_results]
+
+
+async def _maps_paged_results_async(
+    query: str,
+    location_coords: Tuple[float, float],
+    radius_in_meters: int = DFLT_RADIUS_IN_METERS,
+    *,
+    client: _AsyncMapsClient,
+    seconds_between_requests: int = 2,
+    max_results: Optional[int] = None,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Async version of `maps_paged_results`."""
+    places_kwargs = dict(query=query, location=location_coords, radius=radius_in_meters)
+    response = await client.places(**places_kwargs)
+    results = response.get('results', [])
+    n_yielded = len(results)
+    yield results
+
+    while 'next_page_token' in response and (
+        max_results is None or n_yielded < max_results
+    ):
+        response = await _next_places_page_async(
+            client,
+            response['next_page_token'],
+            max_delay=seconds_between_requests,
+            **places_kwargs,
+        )
+        results = response.get('results', [])
+        n_yielded += len(results)
+        yield results
+
+
+async def _next_places_page_async(client, page_token, *, max_delay, **places_kwargs):
+    """Async version of `_next_places_page`."""
+    for i, delay in enumerate(PAGE_TOKEN_RETRY_DELAYS, 1):
+        await asyncio.sleep(min(delay, max_delay))
+        try:
+            return await client.places(page_token=page_token, **places_kwargs)
+        except ApiError as e:
+            if e.status != 'INVALID_REQUEST' or i == len(PAGE_TOKEN_RETRY_DELAYS):
+                raise
 
 
 # -------------------------------------------------------------------------------------
@@ -406,6 +1173,22 @@ def get_latlon(
 import math
 
 
+@lru_cache(maxsize=None)
+def _numba():
+    """The numba module, imported on first use (importing it takes longer than
+    importing ug), or None if it's not installed (it's optional)."""
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba
+
+
+# Radius of the Earth in meters
+EARTH_RADIUS_IN_METERS = 6371000
+_DEG2RAD = math.pi / 180  # radians per degree: multiplying by it is math.radians
+
+
 def haversine_distance(latlon1, latlon2):
     """
     Calculate the distance between two points on the Earth's surface using the Haversine formula.
@@ -443,32 +1226,138 @@ def haversine_distance(latlon1, latlon2):
     >>>  # Same location (London)
     >>> haversine_distance((51.5074, -0.1278), (51.5074, -0.1278))
     0.0
+    >>> # Unknown coordinates give an unknown distance
+    >>> haversine_distance((float('nan'), 2.3522), (40.7128, -74.0060))
+    nan
     """
     lat1, lon1 = latlon1
     lat2, lon2 = latlon2
+    # Floats only, so that the jitted function has a single signature to compile
+    haversine = _haversine_distance()
+    return haversine(float(lat1), float(lon1), float(lat2), float(lon2))
+
 
-    # Radius of the Earth in meters
-    R = 6371000
+def _haversine_core(lat1, lon1, lat2, lon2):
+    # Local aliases of the math functions (faster lookups in pure python), made in
+    # the body, not as default arguments: numba compiles those as "omitted"
+    # arguments, and its dispatcher is slow for them, making calls to the jitted
+    # function ~30x slower (3.4s instead of 0.1s for 100k haversine_distance calls)
+    sqrt = math.sqrt
+    sin, cos, asin = math.sin, math.cos, math.asin
 
     # Convert latitudes and longitudes from degrees to radians
-    phi1 = math.radians(lat1)
-    phi2 = math.radians(lat2)
-    delta_phi = math.radians(lat2 - lat1)
-    delta_lambda = math.radians(lon2 - lon1)
+    phi1 = lat1 * _DEG2RAD
+    phi2 = lat2 * _DEG2RAD
+    delta_phi = phi2 - phi1
+    delta_lambda = (lon2 - lon1) * _DEG2RAD
 
     # Haversine formula
-    a = (
-        math.sin(delta_phi / 2) ** 2
-        + math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2
-    )
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    a = sin(delta_phi / 2) ** 2 + cos(phi1) * cos(phi2) * sin(delta_lambda / 2) ** 2
+    # a is in [0, 1], where asin(sqrt(a)) == atan2(sqrt(a), sqrt(1 - a)) (but cheaper)
+    # The clamp guards against rounding taking a (near antipodes) slightly above 1
+    # (written so that a NaN a, from NaN coordinates, stays NaN)
+    c = 2 * asin(sqrt(1.0 if a > 1.0 else a))
 
     # Distance in meters
-    distance = R * c
+    distance = EARTH_RADIUS_IN_METERS * c
 
     return distance
 
 
+@lru_cache(maxsize=None)
+def _haversine_distance():
+    """_haversine_core, compiled to machine code (on first use) if numba is installed"""
+    numba = _numba()
+    if numba is None:
+        return _haversine_core
+    return numba.njit(cache=True, fastmath=True)(_haversine_core)
+
+
+def haversine_matrix(latlons_a, latlons_b, *, parallel=False):
+    """
+    Calculate the distances (in meters) between each point of ``latlons_a`` and each
+    point of ``latlons_b``, vectorized with numpy (which needs to be installed).
+
+    Returns an array of shape ``(len(latlons_a), len(latlons_b))``.
+
+    With ``parallel=True`` (and numba installed, with several threads), the pairs are
+    instead computed by a compiled loop split over numba's threads. That's only worth
+    it for large matrices: the loop takes about a second to compile on first use
+    (when it's not in numba's cache yet), and numpy's ufuncs are fast on one thread.
+
+    >>> paris, new_york, london = (48.8566, 2.3522), (40.7128, -74.0060), (51.5074, -0.1278)
+    >>> haversine_matrix([paris, new_york], [london, paris]).round()  # doctest: +SKIP
+    array([[ 343556.,       0.],
+           [5570222., 5837241.]])
+    """
+    import numpy as np
+
+    # Converted to radians once, for all the (vectorized) trigonometry that follows
+    a = np.asarray(latlons_a, dtype=float).reshape(-1, 2) * _DEG2RAD
+    b = np.asarray(latlons_b, dtype=float).reshape(-1, 2) * _DEG2RAD
+    numba = _numba() if parallel else None
+    if numba is not None and numba.get_num_threads() > 1:
+        # A loop over pairs, split over (numba's) threads, without numpy's temporary
+        # arrays
+        distances = np.empty((len(a), len(b)))
+        _haversine_pairwise()(a, b, np.cos(b[:, 0]), distances)
+        return distances
+
+    phi1, lambda1 = a[:, :1], a[:, 1:]  # columns, to broadcast against b's rows
+    phi2, lambda2 = b[:, 0], b[:, 1]
+
+    h = (
+        np.sin((phi2 - phi1) / 2) ** 2
+        + np.cos(phi1) * np.cos(phi2) * np.sin((lambda2 - lambda1) / 2) ** 2
+    )
+    # asin(sqrt(h)) is atan2(sqrt(h), sqrt(1 - h)) with one less transcendental
+    return 2 * EARTH_RADIUS_IN_METERS * np.arcsin(np.sqrt(np.minimum(h, 1.0)))
+
+
+@lru_cache(maxsize=None)
+def _haversine_pairwise():
+    """The compiled (on first use) kernel of the parallel haversine_matrix.
+
+    Needs numba.
+    """
+    from numba import njit, prange
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def haversine_pairwise(a, b, cos_lat_b, out):
+        # out[i, j] = distance between a[i] and b[j] (latlons in radians), computing
+        # the (per point) cosines of latitudes outside of the loop over pairs
+        # (no default arguments, and NaN-preserving clamp: see _haversine_core)
+        for i in prange(a.shape[0]):
+            phi1, lambda1 = a[i, 0], a[i, 1]
+            cos_phi1 = math.cos(phi1)
+            for j in range(b.shape[0]):
+                h = (
+                    math.sin((b[j, 0] - phi1) / 2) ** 2
+                    + cos_phi1 * cos_lat_b[j] * math.sin((b[j, 1] - lambda1) / 2) ** 2
+                )
+                out[i, j] = (
+                    2
+                    * EARTH_RADIUS_IN_METERS
+                    * math.asin(math.sqrt(1.0 if h > 1.0 else h))
+                )
+
+    return haversine_pairwise
+
+
+def haversine_distance_bulk(latlon1, latlons, *, parallel=False):
+    """
+    Calculate the distances (in meters) between the ``latlon1`` point and each of the
+    ``latlons`` points, vectorized with numpy (which needs to be installed).
+
+    Returns an array of ``len(latlons)`` distances. Same math as ``haversine_matrix``.
+
+    >>> paris, new_york, london = (48.8566, 2.3522), (40.7128, -74.0060), (51.5074, -0.1278)
+    >>> haversine_distance_bulk(paris, [new_york, london, paris]).round()  # doctest: +SKIP
+    array([5837241.,  343556.,       0.])
+    """
+    return haversine_matrix([latlon1], latlons, parallel=parallel)[0]
+
+
 # import time
 
 # from ug.util import ensure_gmaps_client
@@ -1,11 +1,35 @@
 """Utils for ug"""
 
 import os
+import copy
+import json
+import time
+import random
+import shelve
+import threading
+from functools import lru_cache
+from contextlib import contextmanager
 from typing import Union, Any, MutableMapping, Callable, KT, VT
 
+import requests
+from requests.adapters import HTTPAdapter
 from googlemaps import Client
 
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional: it only parses (Maps responses) faster
+    orjson = None
+    json_loads = json.loads
+
+try:
+    import fcntl
+except ImportError:  # on Windows: DiskCache instances are then only shared by threads
+    fcntl = None
+
 DFLT_GOOGLE_API_KEY_ENV_VAR = '$GOOGLE_API_KEY'
+DFLT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'ug')
 
 
 APIKeyT = str
@@ -31,7 +55,24 @@ def ensure_gmaps_client(
     else:
         key = resolve_env_var_if_starts_with_dollar_sign(client_spec)
         # at this point key could be None, or the actual key itself...
-        return Client(key=key)
+        return _gmaps_client_for_key(key)
+
+
+@lru_cache(maxsize=8)
+def _gmaps_client_for_key(key) -> Client:
+    # One client per key, so that its session (connection pool, keep-alive) is reused
+    session = requests.Session()
+    # Room for the connections of concurrent searches (requests' default is 10)
+    session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32))
+    if orjson is not None:
+        session.hooks['response'].append(_parse_json_with_orjson)
+    return Client(key=key, requests_session=session)
+
+
+def _parse_json_with_orjson(response, *args, **kwargs):
+    # googlemaps parses all its responses with response.json()
+    response.json = lambda **kwargs: orjson.loads(response.content)
+    return response
 
 
 def ensure_kv_writer(writer_spec: KvWriterSpec) -> KvWriterFunc:
@@ -39,3 +80,140 @@ def ensure_kv_writer(writer_spec: KvWriterSpec) -> KvWriterFunc:
         return writer_spec
     else:
         return writer_spec.__setitem__
+
+
+def backoff_seconds(attempt: int, max_seconds: float = float('inf')) -> float:
+    """Seconds to wait before retrying, after the ``attempt``-th (0-based) try failed:
+    ``2 ** attempt`` plus up to a second of jitter, and at most ``max_seconds``.
+
+    >>> 4 <= backoff_seconds(2) < 5
+    True
+    >>> backoff_seconds(10, max_seconds=30)
+    30
+    """
+    # Exponential backoff, with jitter so that concurrent retries don't synchronize
+    return min(max_seconds, 2**attempt + random.random())
+
+
+class RateLimiter:
+    """Context manager spacing out the entries in its block, across threads, so that
+    there are at most ``max_calls_per_second`` of them per second.
+
+    >>> rate_limiter = RateLimiter(max_calls_per_second=100)
+    >>> tic = time.monotonic()
+    >>> for _ in range(3):
+    ...     with rate_limiter:
+    ...         pass
+    >>> time.monotonic() - tic >= 0.02
+    True
+    """
+
+    def __init__(self, max_calls_per_second: float):
+        self.min_interval = 1 / max_calls_per_second
+        self._next_call_time = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve the next call slot, returning how many seconds to wait for it.
+
+        This doesn't block, so it can also be used from async code
+        (``await asyncio.sleep(rate_limiter.reserve())``).
+        """
+        with self._lock:
+            now = time.monotonic()
+            call_time = max(now, self._next_call_time)
+            self._next_call_time = call_time + self.min_interval
+        return call_time - now
+
+    def wait(self):
+        """Block until the next call is allowed."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def __enter__(self):
+        self.wait()
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def rate_limited_client(client: Client, rate_limiter: RateLimiter) -> Client:
+    """A copy of the ``client`` whose requests (retries included) first wait for the
+    ``rate_limiter``.
+
+    The copy shares its http session, so its connection pool, with ``client``.
+    """
+    limited_client = copy.copy(client)
+    request = limited_client._request
+
+    def _request(*args, **kwargs):
+        rate_limiter.wait()
+        return request(*args, **kwargs)
+
+    # googlemaps' Client makes all its requests (and retries) through _request
+    limited_client._request = _request
+    return limited_client
+
+
+_disk_cache_lock = threading.Lock()
+
+
+class DiskCache(MutableMapping):
+    """A persistent ``str``-keyed store of picklable values, that threads can share.
+
+    Stored with ``shelve``, in the ``name`` file(s) of the ``rootdir`` folder.
+    The shelf is only open during each operation, and (``shelve``'s dbm files not
+    supporting concurrent writers) under a lock, so that several ``DiskCache``
+    instances can use the same one: in threads, and (where ``fcntl`` file locks are
+    available, i.e. not on Windows) in processes.
+
+    >>> import tempfile
+    >>> cache = DiskCache(tempfile.mkdtemp(), 'test')
+    >>> cache['Paris'] = (48.8566, 2.3522)
+    >>> DiskCache(cache.rootdir, 'test').get('Paris')
+    (48.8566, 2.3522)
+    >>> list(cache), len(cache)
+    (['Paris'], 1)
+    """
+
+    def __init__(self, rootdir: str, name: str):
+        self.rootdir = rootdir
+        self.name = name
+        self.filepath = os.path.join(rootdir, name)
+
+    @contextmanager
+    def _open(self):
+        with _disk_cache_lock:
+            os.makedirs(self.rootdir, exist_ok=True)
+            if fcntl is None:
+                with shelve.open(self.filepath) as shelf:
+                    yield shelf
+                return
+            # Processes exclude each other with a lock on a file next to the shelf's
+            with open(self.filepath + '.lock', 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)  # released at close
+                with shelve.open(self.filepath) as shelf:
+                    yield shelf
+
+    def __getitem__(self, k):
+        with self._open() as shelf:
+            return shelf[k]
+
+    def __setitem__(self, k, v):
+        with self._open() as shelf:
+            shelf[k] = v
+
+    def __delitem__(self, k):
+        with self._open() as shelf:
+            del shelf[k]
+
+    def __iter__(self):
+        with self._open() as shelf:
+            keys = list(shelf)
+        yield from keys
+
+    def __len__(self):
+        with self._open() as shelf:
+            return len(shelf)